@@ -8,12 +8,19 @@ import os
 import glob
 from datetime import datetime
 
+CATEGORICAL_COLUMNS = {
+    'category': 'category',
+    'deadline': 'category',
+    'crawled_at': 'category',
+}
+
 def analyze_opportunities(csv_file_path):
     """Analyze the opportunities data and provide insights"""
     
     try:
-        # Read the CSV file
-        df = pd.read_csv(csv_file_path, encoding='utf-8')
+        # Read the CSV file; low-cardinality columns are loaded as categoricals
+        # so repeated category/deadline/timestamp strings are stored only once
+        df = pd.read_csv(csv_file_path, encoding='utf-8', dtype=CATEGORICAL_COLUMNS)
         
         print("🎯 OPPORTUNITY SCRAPER ANALYSIS REPORT")
         print("=" * 50)
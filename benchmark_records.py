@@ -0,0 +1,107 @@
+"""
+Opportunity Record Memory Benchmark
+Compares per-row dicts against the columnar OpportunityBatch at 10k, 100k and 1M rows
+"""
+
+import gc
+import io
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from opportunity_records import Category, OpportunityBatch
+
+ROW_COUNTS = [10_000, 100_000, 1_000_000]
+
+# Realistic mix of category combinations and deadlines seen in output/*.csv
+CATEGORY_MIX = [
+    Category.JOB, Category.SCHOLARSHIP, Category.TRAINING, Category.COMPETITION,
+    Category.JOB | Category.TRAINING, Category.JOB | Category.COMPETITION,
+    Category.SCHOLARSHIP | Category.ENTREPRENEURSHIP,
+]
+DEADLINE_MIX = ['Not specified'] * 8 + ['15-08-2025', '12-08-2025']
+
+def _category_string(flags):
+    """Build the category string the way the old dict-based code did: fresh per row"""
+    names = [name for name, flag in (
+        ('Job', Category.JOB), ('Scholarship', Category.SCHOLARSHIP),
+        ('Training', Category.TRAINING), ('Competition', Category.COMPETITION),
+        ('Entrepreneurship', Category.ENTREPRENEURSHIP)) if flags & flag]
+    return ', '.join(names)
+
+def _row_fields(i):
+    return (
+        f"Opportunity title number {i}",
+        f"Description text for opportunity {i}, with a few more words to be realistic",
+        DEADLINE_MIX[i % len(DEADLINE_MIX)],
+        f"https://example.org/opportunities/{i}",
+        CATEGORY_MIX[i % len(CATEGORY_MIX)],
+    )
+
+def build_dicts(n):
+    """Old layout: extractor dict copied into a result dict with its own timestamp"""
+    results = []
+    for i in range(n):
+        title, description, deadline, url, flags = _row_fields(i)
+        opp = {
+            'title': title,
+            'description': description,
+            'deadline': deadline,
+            'url': url,
+            'category': _category_string(flags),
+        }
+        results.append({
+            "opportunity_title": opp['title'],
+            "description": opp['description'],
+            "deadline": opp['deadline'],
+            "link": opp['url'],
+            "category": opp['category'],
+            "crawled_at": datetime.now(timezone.utc).isoformat()
+        })
+    return results
+
+def build_batch(n):
+    """New layout: columnar batch with bitmask categories and a shared timestamp"""
+    batch = OpportunityBatch()
+    for i in range(n):
+        batch.append(*_row_fields(i))
+    return batch
+
+def measure(builder, n):
+    """Return (peak bytes retained, build seconds, result)"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = builder(n)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, elapsed, result
+
+def main():
+    """Print a memory/time comparison for each row count"""
+    counts = [int(arg) for arg in sys.argv[1:]] or ROW_COUNTS
+
+    print("📏 OPPORTUNITY RECORD MEMORY BENCHMARK")
+    print("=" * 72)
+    print(f"  {'rows':>9} | {'dicts MB':>9} | {'batch MB':>9} | {'saving':>7} | {'dicts s':>7} | {'batch s':>7}")
+    print("  " + "-" * 68)
+
+    for n in counts:
+        dict_bytes, dict_time, dicts = measure(build_dicts, n)
+        del dicts
+        batch_bytes, batch_time, batch = measure(build_batch, n)
+
+        saving = (1 - batch_bytes / dict_bytes) * 100 if dict_bytes else 0.0
+        print(f"  {n:>9,} | {dict_bytes / 1e6:>9.1f} | {batch_bytes / 1e6:>9.1f} | "
+              f"{saving:>6.1f}% | {dict_time:>7.2f} | {batch_time:>7.2f}")
+
+        # Export cost: CSV is streamed from the columns without building row dicts
+        start = time.perf_counter()
+        batch.write_csv(io.StringIO())
+        print(f"  {'':>9}   CSV export: {time.perf_counter() - start:.2f}s")
+        del batch
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,6 @@
 import requests
 from bs4 import BeautifulSoup
-import csv
-from datetime import datetime, timezone
+from datetime import datetime
 import re
 import time
 import gspread
@@ -11,39 +10,40 @@ import os
 import ssl
 import urllib3
 from google.auth.transport.urllib3 import AuthorizedHttp
+from opportunity_records import Category, OpportunityRecord, OpportunityBatch
 
 def categorize_opportunity(text):
-    """Categorize the type of opportunity based on text content"""
+    """Categorize the type of opportunity based on text content (empty flags mean 'Other')"""
     text_lower = text.lower()
     
-    categories = []
+    categories = Category(0)
     
     # Job-related keywords
     job_keywords = ['job', 'career', 'employment', 'hiring', 'vacancy', 'position', 'recruit', 'work', 'intern']
     if any(keyword in text_lower for keyword in job_keywords):
-        categories.append('Job')
+        categories |= Category.JOB
     
     # Scholarship keywords
     scholarship_keywords = ['scholarship', 'financial aid', 'grant', 'funding', 'bursary', 'fellowship']
     if any(keyword in text_lower for keyword in scholarship_keywords):
-        categories.append('Scholarship')
+        categories |= Category.SCHOLARSHIP
     
     # Training/Education keywords
     training_keywords = ['training', 'course', 'education', 'learn', 'bootcamp', 'workshop', 'skill', 'certification']
     if any(keyword in text_lower for keyword in training_keywords):
-        categories.append('Training')
+        categories |= Category.TRAINING
     
     # Competition/Challenge keywords
     competition_keywords = ['competition', 'challenge', 'hackathon', 'contest', 'prize']
     if any(keyword in text_lower for keyword in competition_keywords):
-        categories.append('Competition')
+        categories |= Category.COMPETITION
     
     # Entrepreneurship keywords
     entrepreneur_keywords = ['entrepreneur', 'startup', 'business', 'innovation', 'venture']
     if any(keyword in text_lower for keyword in entrepreneur_keywords):
-        categories.append('Entrepreneurship')
+        categories |= Category.ENTREPRENEURSHIP
     
-    return ', '.join(categories) if categories else 'Other'
+    return categories
 
 def extract_deadline(text):
     """Extract deadline from text using various patterns"""
@@ -163,14 +163,14 @@ def extract_detailed_opportunities(soup, base_url):
                     continue
                 
                 category = categorize_opportunity(f"{title} {description}")
-                if category != 'Other':
-                    opportunities.append({
-                        'title': title[:200],
-                        'description': description[:500] if description else 'No description available',
-                        'deadline': deadline or 'Not specified',
-                        'url': link_url,
-                        'category': category
-                    })
+                if category:
+                    opportunities.append(OpportunityRecord(
+                        title=title[:200],
+                        description=description[:500] if description else 'No description available',
+                        deadline=deadline or 'Not specified',
+                        url=link_url,
+                        category=category
+                    ))
                     processed_urls.add(link_url)
                     
         except Exception as e:
@@ -216,14 +216,14 @@ def extract_detailed_opportunities(soup, base_url):
                         continue
                     
                     category = categorize_opportunity(link_text)
-                    if category != 'Other':
-                        opportunities.append({
-                            'title': link_text[:200],
-                            'description': description[:500] if description else 'No description available',
-                            'deadline': deadline or 'Not specified',
-                            'url': link_url,
-                            'category': category
-                        })
+                    if category:
+                        opportunities.append(OpportunityRecord(
+                            title=link_text[:200],
+                            description=description[:500] if description else 'No description available',
+                            deadline=deadline or 'Not specified',
+                            url=link_url,
+                            category=category
+                        ))
                         processed_urls.add(link_url)
                         
             except Exception as e:
@@ -233,8 +233,8 @@ def extract_detailed_opportunities(soup, base_url):
     unique_opportunities = []
     seen_urls = set()
     for opp in opportunities:
-        if opp['url'] not in seen_urls:
-            seen_urls.add(opp['url'])
+        if opp.url not in seen_urls:
+            seen_urls.add(opp.url)
             unique_opportunities.append(opp)
     
     return unique_opportunities[:12]
@@ -294,15 +294,10 @@ def upload_to_google_sheets(results, sheet_name="Opportunities"):
             worksheet = spreadsheet.add_worksheet(title=sheet_name, rows="1000", cols="20")
         
         # Prepare data for upload
-        if results:
-            # Get headers from first result
-            headers = list(results[0].keys())
-            
-            # Prepare all data
-            data = [headers]
-            for result in results:
-                row = [result.get(header, '') for header in headers]
-                data.append(row)
+        if len(results):
+            # Header row plus one list per opportunity, built straight from the columns
+            data = results.to_sheet_rows()
+            headers = data[0]
             
             # Upload data
             worksheet.update('A1', data)
@@ -329,7 +324,8 @@ def upload_to_google_sheets(results, sheet_name="Opportunities"):
 with open("urls.txt", "r") as f:
     urls = [line.strip() for line in f if line.strip()]
 
-results = []
+# Every row from this run shares one crawled_at timestamp
+results = OpportunityBatch()
 
 # Step 2: Crawl each URL
 print(f"Starting to crawl {len(urls)} websites for opportunities...")
@@ -353,14 +349,7 @@ for i, url in enumerate(urls, 1):
         if opportunities:
             # Add each opportunity as a separate row
             for opp in opportunities:
-                results.append({
-                    "opportunity_title": opp['title'],
-                    "description": opp['description'],
-                    "deadline": opp['deadline'],
-                    "link": opp['url'],
-                    "category": opp['category'],
-                    "crawled_at": datetime.now(timezone.utc).isoformat()
-                })
+                results.add_record(opp)
         else:
             # If no specific opportunities found, check the main page
             title = soup.title.string.strip() if soup.title else "No title"
@@ -369,26 +358,12 @@ for i, url in enumerate(urls, 1):
             
             # Check if main page itself is an opportunity
             main_category = categorize_opportunity(f"{title} {description} {url}")
-            if main_category != 'Other':
-                results.append({
-                    "opportunity_title": title,
-                    "description": description,
-                    "deadline": "Not specified",
-                    "link": url,
-                    "category": main_category,
-                    "crawled_at": datetime.now(timezone.utc).isoformat()
-                })
+            if main_category:
+                results.append(title, description, "Not specified", url, main_category)
             
     except Exception as e:
         print(f"Error crawling {url}: {str(e)}")
-        results.append({
-            "opportunity_title": "ERROR",
-            "description": str(e),
-            "deadline": "N/A",
-            "link": url,
-            "category": "Error",
-            "crawled_at": datetime.now(timezone.utc).isoformat()
-        })
+        results.append("ERROR", str(e), "N/A", url, Category.ERROR)
     
     # Add small delay to be respectful to servers
     time.sleep(1)
@@ -400,24 +375,16 @@ output_file = f"output/opportunities_{timestamp}.csv"
 # Create output directory if it doesn't exist
 os.makedirs("output", exist_ok=True)
 
-fieldnames = [
-    "opportunity_title", "description", "deadline", "link", "category", "crawled_at"
-]
-
 try:
     with open(output_file, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(results)
+        results.write_csv(f)
     print(f"✅ Crawl complete! Found {len(results)} opportunities saved to {output_file}")
 except PermissionError:
     # Try alternative filename if file is locked
     alternative_file = f"output/opportunities_backup_{timestamp}.csv"
     try:
         with open(alternative_file, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(results)
+            results.write_csv(f)
         print(f"✅ Original file was locked. Saved to {alternative_file}")
         output_file = alternative_file
     except Exception as e:
@@ -426,17 +393,14 @@ except PermissionError:
         output_file = None
 
 # Print summary statistics
-categories = {}
-for result in results:
-    cat = result['category']
-    categories[cat] = categories.get(cat, 0) + 1
+categories = results.category_counts()
 
 print("\n📊 Opportunity Categories Found:")
 for category, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
     print(f"  {category}: {count}")
 
 # Count opportunities with deadlines
-with_deadlines = sum(1 for r in results if r['deadline'] != 'Not specified' and r['deadline'] != 'N/A')
+with_deadlines = results.count_with_deadlines()
 print(f"\n📅 Opportunities with specified deadlines: {with_deadlines}")
 print(f"🔗 Total websites crawled: {len(urls)}")
 print(f"📝 Total opportunities extracted: {len(results)}")
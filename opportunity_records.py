@@ -0,0 +1,134 @@
+"""
+Compact Opportunity Records
+Slot-based records and a columnar batch for crawled opportunities
+"""
+
+import csv
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import IntFlag
+from functools import lru_cache
+import sys
+
+FIELDNAMES = [
+    "opportunity_title", "description", "deadline", "link", "category", "crawled_at"
+]
+
+class Category(IntFlag):
+    """Opportunity categories stored as a bitmask (no bits set means 'Other')"""
+    JOB = 1
+    SCHOLARSHIP = 2
+    TRAINING = 4
+    COMPETITION = 8
+    ENTREPRENEURSHIP = 16
+    ERROR = 32
+
+# Display order matches the order categorize_opportunity checks keywords in
+CATEGORY_LABELS = [
+    (Category.JOB, 'Job'),
+    (Category.SCHOLARSHIP, 'Scholarship'),
+    (Category.TRAINING, 'Training'),
+    (Category.COMPETITION, 'Competition'),
+    (Category.ENTREPRENEURSHIP, 'Entrepreneurship'),
+    (Category.ERROR, 'Error'),
+]
+
+@lru_cache(maxsize=None)
+def category_label(flags):
+    """Return the interned display string for a category bitmask, e.g. 'Job, Training'"""
+    labels = [label for flag, label in CATEGORY_LABELS if flags & flag]
+    return sys.intern(', '.join(labels) if labels else 'Other')
+
+def run_timestamp():
+    """Return a single interned UTC timestamp to share across every row of a crawl run"""
+    return sys.intern(datetime.now(timezone.utc).isoformat())
+
+@dataclass(slots=True)
+class OpportunityRecord:
+    """A single extracted opportunity"""
+    title: str
+    description: str
+    deadline: str
+    url: str
+    category: Category
+
+    @property
+    def category_label(self):
+        return category_label(self.category)
+
+class OpportunityBatch:
+    """Columnar container for a crawl run's opportunities.
+
+    Each field is held in its own list, categories are kept as integer
+    bitmasks and every row shares the run's crawled_at string, so no
+    per-row dict or category string is ever built.
+    """
+
+    __slots__ = ('titles', 'descriptions', 'deadlines', 'links', 'categories', 'crawled_at')
+
+    def __init__(self, crawled_at=None):
+        self.titles = []
+        self.descriptions = []
+        self.deadlines = []
+        self.links = []
+        self.categories = []
+        self.crawled_at = crawled_at or run_timestamp()
+
+    def __len__(self):
+        return len(self.links)
+
+    def append(self, title, description, deadline, link, category):
+        """Add one row; deadlines are interned since the same few values repeat heavily"""
+        self.titles.append(title)
+        self.descriptions.append(description)
+        self.deadlines.append(sys.intern(deadline))
+        self.links.append(link)
+        self.categories.append(int(category))
+
+    def add_record(self, record):
+        """Add an OpportunityRecord produced by the extractors"""
+        self.append(record.title, record.description, record.deadline, record.url, record.category)
+
+    def iter_rows(self):
+        """Yield rows as tuples in FIELDNAMES order"""
+        crawled_at = self.crawled_at
+        for title, description, deadline, link, flags in zip(
+                self.titles, self.descriptions, self.deadlines, self.links, self.categories):
+            yield (title, description, deadline, link, category_label(flags), crawled_at)
+
+    def write_csv(self, file_obj):
+        """Write the header and all rows to an open text file"""
+        writer = csv.writer(file_obj)
+        writer.writerow(FIELDNAMES)
+        writer.writerows(self.iter_rows())
+
+    def to_sheet_rows(self):
+        """Return header plus rows as lists, ready for worksheet.update"""
+        data = [list(FIELDNAMES)]
+        data.extend(list(row) for row in self.iter_rows())
+        return data
+
+    def to_dataframe(self):
+        """Build a pandas DataFrame straight from the columns"""
+        import pandas as pd
+
+        n = len(self)
+        return pd.DataFrame({
+            "opportunity_title": self.titles,
+            "description": self.descriptions,
+            "deadline": pd.Categorical(self.deadlines),
+            "link": self.links,
+            "category": pd.Categorical([category_label(flags) for flags in self.categories]),
+            "crawled_at": pd.Categorical([self.crawled_at] * n),
+        }, columns=FIELDNAMES)
+
+    def category_counts(self):
+        """Count rows per category label"""
+        counts = {}
+        for flags in self.categories:
+            counts[flags] = counts.get(flags, 0) + 1
+        return {category_label(flags): count for flags, count in counts.items()}
+
+    def count_with_deadlines(self):
+        """Count rows whose deadline is an actual date"""
+        return sum(1 for d in self.deadlines if d != 'Not specified' and d != 'N/A')